@@ -1,7 +1,6 @@
 import asyncio
 import itertools
 import rateman
-import time
 
 
 __all__ = ["configure", "run"]
@@ -17,9 +16,10 @@ enabling each rate for a given duration.
 # the interval at which the rate selection is to be updated. We return handles to the station object
 # and the parsed interval, because we'll need both in run().
 async def configure(sta: rateman.Station, **rc_opts: dict) -> object:
-    # enable manual rate control for the station
-    await sta.set_manual_rc_mode(True)
-    await sta.set_manual_tpc_mode(False)
+    # enable manual rate control for the station. Both mode switches are sent in a single write.
+    async with sta.accesspoint.batch():
+        await sta.set_manual_rc_mode(True)
+        await sta.set_manual_tpc_mode(False)
 
     # parse rc options
     interval = rc_opts.get("interval_ms", 1000)
@@ -33,18 +33,20 @@ async def configure(sta: rateman.Station, **rc_opts: dict) -> object:
 async def run(args):
     sta = args[0]
     interval = args[1]
-    log = sta.logger
+    log = sta.log
 
     # cycle through all of the STA's supported rates, setting each rate for the duration of
     # interval_ms.
+    loop = asyncio.get_running_loop()
+    deadline = loop.time()
     for rate in itertools.cycle(sta.supported_rates):
-        start = time.perf_counter_ns()
-
         log.debug(f"Setting rate={rate} for {interval} ms")
 
         # issue the rate control settings command
         await sta.set_rates([rate], [1])
 
-        elapsed_milliseconds = (time.perf_counter_ns() - start) / 1_000_000
-
-        await asyncio.sleep((interval - elapsed_milliseconds) / 1000)
+        # sleep until the next rate is due. Waiting for deadlines on the loop's clock keeps the
+        # time spent setting the rate and oversleeping from adding up. If we fell behind, we start
+        # over from now instead of catching up.
+        deadline = max(deadline + interval / 1000, loop.time())
+        await asyncio.sleep(deadline - loop.time())
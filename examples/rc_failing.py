@@ -17,9 +17,10 @@ enabling each rate for a given duration.
 # the interval at which the rate selection is to be updated. We return handles to the station object
 # and the parsed interval, because we'll need both in run().
 async def configure(sta: rateman.Station, **rc_opts: dict) -> object:
-    # enable manual rate control for the station
-    await sta.set_manual_rc_mode(True)
-    await sta.set_manual_tpc_mode(False)
+    # enable manual rate control for the station. Both mode switches are sent in a single write.
+    async with sta.accesspoint.batch():
+        await sta.set_manual_rc_mode(True)
+        await sta.set_manual_tpc_mode(False)
 
     # parse rc options
     interval = rc_opts.get("fail_after_s", 1)
@@ -33,7 +34,7 @@ async def configure(sta: rateman.Station, **rc_opts: dict) -> object:
 async def run(args):
     sta = args[0]
     interval = args[1]
-    log = sta.logger
+    log = sta.log
 
     await asyncio.sleep(interval)
 
@@ -1,7 +1,6 @@
 import asyncio
 import itertools
 import rateman
-import time
 
 
 __all__ = ["configure", "run", "pause", "resume"]
@@ -18,15 +17,20 @@ paused and resumed.
 # the interval at which the rate selection is to be updated. We return handles to the station object
 # and the parsed interval, because we'll need both in run().
 async def configure(sta: rateman.Station, **rc_opts: dict) -> object:
-    # enable manual rate control for the station
-    await sta.set_manual_rc_mode(True)
-    await sta.set_manual_tpc_mode(False)
+    # enable manual rate control for the station. Both mode switches are sent in a single write.
+    async with sta.accesspoint.batch():
+        await sta.set_manual_rc_mode(True)
+        await sta.set_manual_tpc_mode(False)
 
     # parse rc options
     interval = rc_opts.get("interval_ms", 1000)
 
+    # the event is set while the rate control is running and cleared while it is paused
+    running = asyncio.Event()
+    running.set()
+
     # return what we'll need in run()
-    return dict(sta=sta, interval=interval, paused=False)
+    return dict(sta=sta, interval=interval, running=running)
 
 
 # The run() function implements the core rate control logic and is expected to run indefinitely. It
@@ -34,32 +38,31 @@ async def configure(sta: rateman.Station, **rc_opts: dict) -> object:
 async def run(ctx):
     # cycle through all of the STA's supported rates, setting each rate for the duration of
     # interval_ms.
+    loop = asyncio.get_running_loop()
+    deadline = loop.time()
     for rate in itertools.cycle(ctx["sta"].supported_rates):
-        # stop operation if the stop flag is set
-        while ctx["paused"]:
-            await asyncio.sleep(0.1)
-            continue
-
-        start = time.perf_counter_ns()
+        # wait without polling while we are paused
+        await ctx["running"].wait()
 
-        ctx["sta"].logger.debug(f"Setting rate={rate} for {ctx['interval']} ms")
+        ctx["sta"].log.debug(f"Setting rate={rate} for {ctx['interval']} ms")
 
         # issue the rate control settings command
         await ctx["sta"].set_rates([rate], [1])
 
-        elapsed_milliseconds = (time.perf_counter_ns() - start) / 1_000_000
-
-        await asyncio.sleep((ctx["interval"] - elapsed_milliseconds) / 1000)
+        # sleep until the next rate is due. After falling behind, e.g. while paused, we start over
+        # from now instead of catching up.
+        deadline = max(deadline + ctx["interval"] / 1000, loop.time())
+        await asyncio.sleep(deadline - loop.time())
 
 
 # The optional pause() function is called to halt a rate control algorithm without destroying its
 # state. It receives the same argument as run().
 async def pause(ctx):
-    ctx["paused"] = True
+    ctx["running"].clear()
 
 
 # The optional resume() function is called to resume a paused rate control algorithm. It receives
 # the same argument as run().
 async def resume(ctx):
     await ctx["sta"].set_manual_rc_mode(True)
-    ctx["paused"] = False
+    ctx["running"].set()
@@ -5,12 +5,16 @@
 
 import asyncio
 import csv
+import socket
 import sys
+import time
 import logging
-from functools import reduce
+from contextlib import asynccontextmanager, suppress
+from functools import lru_cache
+from typing import Union
 
 from .station import Station
-from .rate_info import *
+from .rate_info import get_rate_info
 from .exception import (
     RadioUnavailableError,
     AccessPointNotConnectedError,
@@ -20,6 +24,42 @@ from .exception import (
 
 __all__ = ["AccessPoint", "from_file", "from_strings"]
 
+RCD_TRACE_BUFSIZE = 1 << 20
+
+# number of bytes requested from the connection at once when receiving ORCA events
+RCD_READ_SIZE = 64 << 10
+
+# longest incomplete line kept while waiting for its line break. Like the limit of asyncio's
+# readline(), this bounds memory use if the accesspoint, or a corrupt stream, never sends one.
+RCD_MAX_LINE_LENGTH = 64 << 10
+
+# an error reported by the accesspoint is logged at most once in this many seconds. Repeats in
+# between are counted and their number is logged with the next report.
+ERROR_LOG_INTERVAL = 10
+# number of distinct errors whose last report is remembered
+ERROR_LOG_MAX_ENTRIES = 64
+
+# number of received chunks waiting to be written to the trace file at which reading events pauses
+# until the trace writer has caught up
+RCD_TRACE_MAX_PENDING = 256
+
+# high and low water marks of the control connection's write buffer. drain() blocks above the
+# former until the buffer has been flushed below the latter.
+RCD_WRITE_BUFFER_HIGH = 64 << 10
+RCD_WRITE_BUFFER_LOW = 8 << 10
+
+# pre-encoded constant commands and fragments for the send path
+_NL = b"\n"
+_DUMP = b"dump"
+_RESET_STATS_ALL = b"reset_stats;all"
+_RESET_STATS_STA = b"reset_stats;%s"
+_TPRC_ECHO = {True: b"start;tprc_echo", False: b"stop;tprc_echo"}
+_ALL_STATIONS_MODE = {
+    (which, mode): f"{which};all;{mode}".encode("ascii")
+    for which in ["rc_mode", "tpc_mode"]
+    for mode in ["manual", "auto"]
+}
+
 
 class AccessPoint:
     """
@@ -32,6 +72,45 @@ class AccessPoint:
     :func:`.from_file`
     """
 
+    # fixed attribute layout: smaller instances and faster attribute access on the hot paths
+    __slots__ = (
+        "_name",
+        "_api_version",
+        "_addr",
+        "_rcd_port",
+        "_all_group_info",
+        "_all_rate_info",
+        "_radios",
+        "_radio_prefixes",
+        "_stations",
+        "_connected",
+        "_latest_timestamp",
+        "_latest_timestamp_digits",
+        "_log",
+        "_loop",
+        "_last_cmd",
+        "_error_reports",
+        "_reader",
+        "_writer",
+        "_txbuf",
+        "_txbuf_len",
+        "_batch_depth",
+        "_coalesce_delay",
+        "_coalesce_max_bytes",
+        "_flush_event",
+        "_flush_task",
+        "_task",
+        "_first_non_header_line",
+        "_record_rcd_trace",
+        "_rcd_trace_file",
+        "_rcd_trace_pending",
+        "_rcd_trace_writer",
+        "_rcd_trace_closing",
+        "_header_collected",
+        "_sample_table",
+        "__weakref__",
+    )
+
     def __init__(self, name: str, addr: str, rcd_port=21059, logger=None, loop=None):
         """
         Parameters
@@ -53,17 +132,35 @@ class AccessPoint:
         self._all_group_info = dict()
         self._all_rate_info = dict()
         self._radios = dict()
+        # pre-encoded command prefixes of the known radios and of the wildcard radio
+        self._radio_prefixes = {"*": b"*;"}
+        # flat index of the stations of all radios by MAC address
+        self._stations = dict()
         self._connected = False
         self._latest_timestamp = 0
+        self._latest_timestamp_digits = 0
         self._log = logger if logger else logging.getLogger()
         self._loop = loop
         self._last_cmd = None
+        # time of the last report and number of suppressed repeats per error, so that a rate control
+        # loop repeatedly sending a failing command does not flood the log
+        self._error_reports = dict()
         self._reader = None
         self._writer = None
+        self._txbuf = []
+        self._txbuf_len = 0
+        self._batch_depth = 0
+        self._coalesce_delay = 0.0
+        self._coalesce_max_bytes = 4096
+        self._flush_event = asyncio.Event()
+        self._flush_task = None
         self._task = None
         self._first_non_header_line = None
         self._record_rcd_trace = False
         self._rcd_trace_file = None
+        self._rcd_trace_pending = []
+        self._rcd_trace_writer = None
+        self._rcd_trace_closing = set()
         self._header_collected = False
 
     async def api_info(self, timeout=0.5):
@@ -74,10 +171,13 @@ class AccessPoint:
                     data = await anext(it)
                     line = data.decode("utf-8")
 
-                if line.startswith("*") or ";0;add" in line or ";0;sta" in line:
+                # header lines are global ones or radios and stations at timestamp 0. Compare the
+                # leading fields rather than searching the whole line.
+                fields = line.split(";", 3)
+                if fields[0] == "*" or fields[1:3] in (["0", "add"], ["0", "sta"]):
                     yield line.rstrip()
                 else:
-                    self._first_non_header_line = data
+                    self._first_non_header_line = data.rstrip(b"\n")
                     return
             except UnicodeError:
                 continue
@@ -90,13 +190,40 @@ class AccessPoint:
             self._first_non_header_line = None
             yield line
 
-        async for data in self._reader:
-            try:
-                if self._record_rcd_trace:
-                    self._rcd_trace_file.write(data.decode("utf-8"))
-                yield data
-            except UnicodeError:
-                continue
+        # Read whatever has arrived in large chunks and split them into lines here instead of
+        # awaiting every line on its own. Lines are yielded without their line break.
+        partial = b""
+        skip_line = False
+        while data := await self._reader.read(RCD_READ_SIZE):
+            if self._record_rcd_trace:
+                await self._record(data)
+
+            lines = data.split(b"\n")
+            if skip_line:
+                # still inside an overlong line, drop everything up to its line break
+                if len(lines) == 1:
+                    continue
+
+                lines[0] = b""
+                skip_line = False
+            elif partial:
+                lines[0] = partial + lines[0]
+
+            # the last element is the beginning of a line that is still incomplete
+            partial = lines.pop()
+            if len(partial) > RCD_MAX_LINE_LENGTH:
+                self._log.warning(
+                    "%s: Dropping line exceeding %d bytes", self._name, RCD_MAX_LINE_LENGTH
+                )
+                partial = b""
+                skip_line = True
+
+            for line in lines:
+                if line:
+                    yield line
+
+        if partial:
+            yield partial
 
     def __str__(self):
         return self._name
@@ -152,6 +279,37 @@ class AccessPoint:
     def logger(self):
         return self._log
 
+    @property
+    def coalesce_delay(self) -> float:
+        """
+        Time in seconds for which commands sent to the accesspoint are held back so that commands
+        sent in the meantime, e.g. by the rate control tasks of several stations, are transmitted
+        together in a single write. Pending commands are written early once they exceed
+        `coalesce_max_bytes`. A delay of 0 (the default) disables coalescing and every command is
+        written immediately. Latency-sensitive commands can bypass the delay with
+        :meth:`send_nodelay`.
+        """
+        return self._coalesce_delay
+
+    @coalesce_delay.setter
+    def coalesce_delay(self, delay: float):
+        if delay < 0:
+            raise ValueError(f"{self}: Invalid coalesce delay {delay}")
+
+        self._coalesce_delay = delay
+
+    @property
+    def coalesce_max_bytes(self) -> int:
+        """
+        Number of bytes of pending commands after which they are written to the accesspoint
+        without waiting for `coalesce_delay` to expire or for :meth:`flush` to be called.
+        """
+        return self._coalesce_max_bytes
+
+    @coalesce_max_bytes.setter
+    def coalesce_max_bytes(self, max_bytes: int):
+        self._coalesce_max_bytes = max_bytes
+
     @property
     def connected(self) -> bool:
         """
@@ -183,30 +341,71 @@ class AccessPoint:
         return self._all_group_info
 
     def get_rate_info(self, rate: int, attr: str = "") -> dict:
-        if rate in self._all_rate_info:
-            rate_info = self._all_rate_info[rate]
-
-            if attr in rate_info.keys():
-                return rate_info[attr]
-            elif attr != "":
-                return
+        rate_info = self._all_rate_info.get(rate)
 
+        if rate_info is None or not attr:
             return rate_info
 
+        return rate_info.get(attr)
+
+    async def _record(self, data: bytes):
+        # Only the trace writer task touches the file, in a worker thread, so a slow disk never
+        # blocks the event loop. Reading events only pauses when the writer falls far behind.
+        self._rcd_trace_pending.append(data)
+
+        if not self._rcd_trace_writer or self._rcd_trace_writer.done():
+            self._rcd_trace_writer = asyncio.create_task(
+                self._write_rcd_trace(self._rcd_trace_file, self._rcd_trace_pending),
+                name=f"rcd_trace_{self._name}",
+            )
+        elif len(self._rcd_trace_pending) >= RCD_TRACE_MAX_PENDING:
+            await asyncio.shield(self._rcd_trace_writer)
+
+    async def _write_rcd_trace(self, file, pending: list):
+        try:
+            while pending:
+                chunks = pending.copy()
+                pending.clear()
+                await asyncio.to_thread(file.writelines, chunks)
+
+            # the recording was stopped while we were writing, so the file is ours to close
+            if file is not self._rcd_trace_file:
+                await asyncio.to_thread(file.close)
+        except OSError as e:
+            self._log.error(f"{self._name}: Failed to write rcd trace, stopping recording: {e}")
+            pending.clear()
+            if file is self._rcd_trace_file:
+                self._rcd_trace_file = None
+                self._rcd_trace_writer = None
+                self._record_rcd_trace = False
+
+            with suppress(OSError):
+                file.close()
+
     def start_recording_rcd_trace(self, path):
         """
         Record incoming ORCA events in a file at the given path.
         """
         self.stop_recording_rcd_trace()
 
-        self._rcd_trace_file = open(path, "w")
+        # events are recorded as received, without decoding them. A large buffer turns the
+        # per-event writes into few, large writes to disk.
+        self._rcd_trace_file = open(path, "wb", buffering=RCD_TRACE_BUFSIZE)
+        self._rcd_trace_pending = []
         self._record_rcd_trace = True
 
     def stop_recording_rcd_trace(self):
-        if self._rcd_trace_file:
+        writer = self._rcd_trace_writer
+        if writer and not writer.done():
+            # the writer finishes writing the pending events and closes the file itself
+            self._rcd_trace_closing.add(writer)
+            writer.add_done_callback(self._rcd_trace_closing.discard)
+        elif self._rcd_trace_file:
             self._rcd_trace_file.close()
 
         self._rcd_trace_file = None
+        self._rcd_trace_writer = None
+        self._rcd_trace_pending = []
         self._record_rcd_trace = False
 
     def stations(self, radio="all") -> list[Station]:
@@ -215,30 +414,24 @@ class AccessPoint:
         list will include the stations of all of the accesspoint's radios.
         """
         if radio == "all":
-            return reduce(
-                lambda a, b: a + b, [self.stations(radio=radio) for radio in self._radios], []
-            )
+            return [sta for info in self._radios.values() for sta in info["stations"].values()]
         elif radio not in self._radios:
             raise AccessPointError(self, f"No such radio '{radio}'")
 
-        return [sta for _, sta in self._radios[radio]["stations"].items()]
-
-    def _get_sta(self, mac, radio):
-        try:
-            return self._radios[radio]["stations"][mac]
-        except KeyError:
-            return None
+        return list(self._radios[radio]["stations"].values())
 
     def get_sta(self, mac: str, radio: str = None) -> "Station":
         if not radio:
-            for radio in self._radios:
-                sta = self.get_sta(mac, radio)
-                if sta:
-                    return sta
+            return self._stations.get(mac)
 
-            return None
+        # called for every txs and rxs event, so look up directly without a helper call
+        info = self._radios.get(radio)
+        return info["stations"].get(mac) if info else None
 
-        return self._get_sta(mac, radio)
+    def _unindex_stations(self, radio):
+        for mac, sta in self._radios[radio].get("stations", {}).items():
+            if self._stations.get(mac) is sta:
+                del self._stations[mac]
 
     def enabled_events(self, radio: str) -> list:
         """
@@ -248,11 +441,15 @@ class AccessPoint:
         return self._radios[radio]["events"]
 
     def get_feature_state(self, radio: str, feature: str):
-        try:
-            if feature not in self._radios[radio]["features"]:
-                raise UnsupportedFeatureException(self, radio, feature)
+        features = self._features(radio)
+        if feature not in features:
+            raise UnsupportedFeatureException(self, radio, feature)
+
+        return features[feature]
 
-            return self._radios[radio]["features"][feature]
+    def _features(self, radio: str) -> dict:
+        try:
+            return self._radios[radio]["features"]
         except KeyError as e:
             raise RadioUnavailableError(self, radio) from e
 
@@ -260,21 +457,16 @@ class AccessPoint:
         """
         Return the list of supported features of a given radio.
         """
-        try:
-            return self._radios[radio]["features"].keys()
-        except KeyError as e:
-            raise RadioUnavailableError(self, radio) from e
+        return self._features(radio).keys()
 
     async def _set_feature(self, radio, feature, val):
-        try:
-            if feature not in self._radios[radio]["features"]:
-                raise UnsupportedFeatureException(self, radio, feature)
-            elif self._radios[radio]["features"][feature] == val:
-                return
-        except KeyError as e:
-            raise RadioUnavailableError(self, radio) from e
+        features = self._features(radio)
+        if feature not in features:
+            raise UnsupportedFeatureException(self, radio, feature)
+        elif features[feature] == val:
+            return
 
-        self._radios[radio]["features"][feature] = val
+        features[feature] = val
         await self.send(radio, f"set_feature;{feature};{val}")
 
     async def set_feature(self, radio: str, feature: str, val: str) -> None:
@@ -298,14 +490,19 @@ class AccessPoint:
     def add_radio(
         self, radio: str, driver: str, ifaces: list, events: list, features: dict, tpc: dict
     ) -> None:
-        self._log.debug(
-            f"{self._name}: adding radio '{radio}', driver={driver}, "
-            f"interfaces={ifaces}, events={events}, "
-            f"features={', '.join([f + ':' + s for f, s in features.items()])} "
-        )
+        if self._log.isEnabledFor(logging.DEBUG):
+            self._log.debug(
+                f"{self._name}: adding radio '{radio}', driver={driver}, "
+                f"interfaces={ifaces}, events={events}, "
+                f"features={', '.join([f + ':' + s for f, s in features.items()])} "
+            )
 
+        radio = sys.intern(radio)
         if radio not in self._radios:
             self._radios[radio] = {}
+            self._radio_prefixes[radio] = f"{radio};".encode("ascii")
+        else:
+            self._unindex_stations(radio)
 
         self._radios[radio].update(
             {
@@ -346,7 +543,7 @@ class AccessPoint:
         try:
             return self._radios[radio]["driver"]
         except KeyError as e:
-            raise RadioUnavailableError(f"{self._name}: No such radio '{radio}'") from e
+            raise RadioUnavailableError(self, radio) from e
 
     def txpowers(self, radio: str) -> list:
         """
@@ -359,7 +556,10 @@ class AccessPoint:
         return self._radios[radio]["tpc"]["txpowers"] if self._radios[radio]["tpc"] else []
 
     async def add_station(self, sta):
-        old_sta = self.get_sta(sta.mac_addr)
+        stations = self._radios[sta.radio]["stations"]
+
+        # the station may be known from a previous association on any of our radios
+        old_sta = self._stations.get(sta.mac_addr)
         if old_sta:
             old_sta.associate(self, sta.radio)
 
@@ -370,23 +570,23 @@ class AccessPoint:
                 await old_sta.resume_rate_control()
             return
 
-        if sta.mac_addr not in self._radios[sta.radio]["stations"]:
-            self._log.debug(f"{self._name}:{sta.radio}: Adding {sta}")
-            self._radios[sta.radio]["stations"][sta.mac_addr] = sta
+        self._log.debug("%s:%s: Adding %s", self._name, sta.radio, sta)
+        stations[sta.mac_addr] = sta
+        self._stations[sta.mac_addr] = sta
 
     async def update_station(self, sta):
-        if sta.mac_addr not in self._radios[sta.radio]["stations"]:
+        old_sta = self._radios[sta.radio]["stations"].get(sta.mac_addr)
+        if not old_sta:
             await self.add_station(sta)
             return
 
-        old_sta = sta.accesspoint.get_sta(sta.mac_addr, radio=sta.radio)
-
         # TODO: do we have to update more than the supported rate set?
         old_sta.supported_rates = sta.supported_rates
 
     async def remove_station(self, mac: str, radio: str) -> Station:
         try:
-            sta = self._radios[radio]["stations"][mac]
+            stations = self._radios[radio]["stations"]
+            sta = stations[mac]
         except KeyError:
             return None
 
@@ -395,78 +595,218 @@ class AccessPoint:
         if sta.pause_rc_on_disassoc:
             await sta.pause_rate_control()
         else:
-            self._log.debug(f"{self._name}:{radio}: Removing {sta}")
-            del self._radios[radio]["stations"][mac]
+            self._log.debug("%s:%s: Removing %s", self._name, radio, sta)
+            del stations[mac]
+            if self._stations.get(mac) is sta:
+                del self._stations[mac]
             await sta.stop_rate_control()
 
         return sta
 
     def update_timestamp(self, timestamp_str):
+        # Malformed timestamps are rare. Validating every string up front costs more than parsing
+        # it, so let int() do the validation.
         try:
             timestamp = int(timestamp_str, 16)
-        except Exception:
+        except ValueError:
             return False
 
-        if self._latest_timestamp == 0:
-            self._latest_timestamp = timestamp
-            return True
-
-        if (
+        if self._latest_timestamp == 0 or (
             timestamp > self._latest_timestamp
-            and len(timestamp_str) - len(f"{self._latest_timestamp:x}") <= 1
+            and len(timestamp_str) - self._latest_timestamp_digits <= 1
         ):
             self._latest_timestamp = timestamp
+            # number of hex digits of the timestamp, without formatting it
+            self._latest_timestamp_digits = (timestamp.bit_length() + 3) >> 2
             return True
 
         return False
 
-    async def send(self, radio: str, cmd: str):
+    def _queue(self, radio: str, cmd: Union[str, bytes]):
         if not self.connected:
+            if isinstance(cmd, bytes):
+                cmd = cmd.decode("ascii").rstrip()
             raise AccessPointNotConnectedError(self, f"Cannot send '{cmd}'")
 
-        if radio != "*" and radio not in self._radios:
+        prefix = self._radio_prefixes.get(radio)
+        if prefix is None:
             raise ValueError(f"{self}: Unknown radio '{radio}'")
 
+        if isinstance(cmd, str):
+            cmd = cmd.encode("ascii")
+
         self._last_cmd = cmd
-        if cmd[-1] != "\n":
-            cmd += "\n"
 
-        self._writer.write(f"{radio};{cmd}".encode("ascii"))
+        # keep the fragments as they are, they are gathered by the transport on flush
+        self._txbuf += [prefix, cmd]
+        if cmd[-1] != 0x0A:
+            self._txbuf.append(_NL)
+
+        self._txbuf_len += len(prefix) + len(cmd) + 1
+
+    def _clear_txbuf(self):
+        self._txbuf.clear()
+        self._txbuf_len = 0
+
+    async def _flush(self):
+        if not self._txbuf:
+            return
+
+        # hand all queued commands to the transport at once
+        self._writer.writelines(self._txbuf)
+        self._clear_txbuf()
 
         await self._writer.drain()
 
+    async def send(self, radio: str, cmd: Union[str, bytes], flush: bool = True):
+        """
+        Send the given command to the given radio. With `flush=False` the command is only queued
+        and written together with later commands once the queued commands exceed
+        `coalesce_max_bytes` or :meth:`flush` is called.
+        """
+        self._queue(radio, cmd)
+
+        if self._batch_depth:
+            return
+
+        if not flush:
+            if self._txbuf_len >= self._coalesce_max_bytes:
+                await self._flush()
+            return
+
+        if self._coalesce_delay and self._txbuf_len < self._coalesce_max_bytes:
+            if not self._flush_task or self._flush_task.done():
+                self._flush_task = asyncio.create_task(self._flusher(), name=f"flush_{self._name}")
+
+            self._flush_event.set()
+            return
+
+        await self._flush()
+
+    async def send_nodelay(self, radio: str, cmd: Union[str, bytes]):
+        """
+        Send the given command right away, regardless of `coalesce_delay`. Commands which are
+        pending at that time are written along with it. Within :meth:`batch`, the command is still
+        held back until the outermost batch is left.
+        """
+        self._queue(radio, cmd)
+
+        if not self._batch_depth:
+            await self._flush()
+
+    async def flush(self) -> None:
+        """
+        Write all queued commands to the accesspoint.
+        """
+        await self._flush()
+
+    async def _flusher(self):
+        while True:
+            await self._flush_event.wait()
+            await asyncio.sleep(self._coalesce_delay)
+            self._flush_event.clear()
+
+            try:
+                await self._flush()
+            except ConnectionError as e:
+                # nobody awaits this task, so report the failure here rather than leaving it in the
+                # task's unretrieved exception. The next send() starts a new flusher.
+                self._log.error(f"{self._name}: Failed to send coalesced commands: {e.__repr__()}")
+                self._clear_txbuf()
+                return
+
+    @asynccontextmanager
+    async def batch(self):
+        """
+        Collect all commands sent to the accesspoint within this context and transmit them in a
+        single write when the outermost context is left. This reduces the number of writes and TCP
+        segments for bursts of commands, e.g., when reconfiguring several stations at once::
+
+            async with ap.batch():
+                await sta.set_manual_rc_mode(True)
+                await sta.set_rates([rate], [1])
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                await self._flush()
+
     def handle_error(self, error):
-        self._log.error(f"{self._name}: Error '{error}', last command='{self._last_cmd}'")
+        now = time.monotonic()
+        last_report, suppressed = self._error_reports.get(error, (None, 0))
+        if last_report is not None and now - last_report < ERROR_LOG_INTERVAL:
+            self._error_reports[error] = (last_report, suppressed + 1)
+            return
+
+        if error not in self._error_reports and len(self._error_reports) >= ERROR_LOG_MAX_ENTRIES:
+            # evict the error reported longest ago
+            del self._error_reports[min(self._error_reports, key=self._error_reports.get)]
+
+        self._error_reports[error] = (now, 0)
+        last_cmd = self._last_cmd.decode("ascii").rstrip() if self._last_cmd else None
+        if suppressed:
+            self._log.error(
+                "%s: Error '%s', last command='%s' (%d more since the last report)",
+                self._name,
+                error,
+                last_cmd,
+                suppressed,
+            )
+        else:
+            self._log.error("%s: Error '%s', last command='%s'", self._name, error, last_cmd)
 
     async def connect(self):
         if self._connected:
-            return
+            # reuse the established connection as long as it is alive to avoid a new handshake
+            if self._writer and not (self._writer.is_closing() or self._reader.at_eof()):
+                return
+
+            self._log.debug("%s: Dropping stale connection", self._name)
+            self._drop_connection()
 
         try:
             r, w = await asyncio.open_connection(self._addr, self._rcd_port)
+            _configure_transport(w)
             self._reader = r
             self._writer = w
             self._connected = True
+            self._error_reports.clear()
         except asyncio.CancelledError as e:
             self._task = None
-            self._connected = False
+            self._drop_connection()
             raise e
         except Exception as e:
             self._log.error(
                 f"{self._name}: Failed to connect at {self._addr}:{self._rcd_port}: {e.__repr__()}"
             )
-            self._connected = False
+            self._drop_connection()
             raise e
 
-        self._log.debug(f"{self._name}: Connected at {self._addr}:{self._rcd_port}")
+        self._log.debug("%s: Connected at %s:%s", self._name, self._addr, self._rcd_port)
+
+    def _drop_connection(self):
+        if self._writer:
+            self._writer.close()
+
+        self._reader = None
+        self._writer = None
+        self._clear_txbuf()
+        self._connected = False
 
     async def disconnect(self, timeout=3.0):
         if self._rcd_trace_file:
             self.stop_recording_rcd_trace()
 
+        # let the trace writers finish writing out what was received before
+        await asyncio.gather(*self._rcd_trace_closing)
+
         if not self._writer:
             return
 
+        stas = []
         for radio in self._radios:
             for sta in self.stations(radio):
                 rc_alg, _ = sta.rate_control
@@ -474,10 +814,25 @@ class AccessPoint:
                     self._log.warning(
                         f"Disconnecting from {self} will leave {sta} without rate control"
                     )
-                    await sta.stop_rate_control()
+                    stas.append(sta)
 
+        await asyncio.gather(*(sta.stop_rate_control() for sta in stas))
+
+        for radio in self._radios:
+            self._unindex_stations(radio)
             self._radios[radio]["stations"] = {}
 
+        if self._flush_task:
+            self._flush_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._flush_task
+
+            self._flush_task = None
+
+        with suppress(ConnectionError):
+            await self._flush()
+
+        self._clear_txbuf()
         self._writer.close()
 
         try:
@@ -489,11 +844,16 @@ class AccessPoint:
         self._writer = None
         self._connected = False
 
-    async def enable_events(self, radio="all", events: list = ["txs"]) -> None:
+    async def enable_events(self, radio="all", events: list = None) -> None:
         """
         Enable the given events for the given radio. If `radio` is `"*"` or
-        `"all"`, the events will be enabled on all the accesspoint's radios.
+        `"all"`, the events will be enabled on all the accesspoint's radios. If no events are given,
+        only `txs` events will be enabled.
         """
+        # a fresh list per call, a list default would be shared between all calls
+        if events is None:
+            events = ["txs"]
+
         if radio in ["all", "*"]:
             radio = "*"
             for r in self._radios:
@@ -505,17 +865,25 @@ class AccessPoint:
             enabled_events.update(events)
             self._radios[radio]["events"] = list(enabled_events)
 
-        await self.disable_events(radio)
+        self._log.debug("%s:%s: Enable events %s", self._name, radio, events)
 
-        self._log.debug(f"{self._name}:{radio}: Enable events {events}")
+        # stop and restart event reporting with a single write
+        async with self.batch():
+            self._disable_events(radio, [])
+            self._queue(radio, _events_cmd("start", tuple(events)))
 
-        await self.send(radio, "start;" + ";".join(events))
-
-    async def disable_events(self, radio="all", events: list = []) -> None:
+    async def disable_events(self, radio="all", events: list = None) -> None:
         """
         Disable the given events for the given radio. If `radio` is `"*"` or
         `"all"`, the events will be disabled on all the accesspoint's radios.
         """
+        if events is None:
+            events = []
+
+        async with self.batch():
+            self._disable_events(radio, events)
+
+    def _disable_events(self, radio, events):
         if radio in ["all", "*"]:
             radio = "*"
             for r in self._radios:
@@ -523,15 +891,15 @@ class AccessPoint:
         else:
             self._radios[radio]["events"] = list(set(self._radios[radio]["events"]) - set(events))
 
-        self._log.debug(f"{self._name}:{radio}: Disable events {events}")
+        self._log.debug("%s:%s: Disable events %s", self._name, radio, events)
 
-        await self.send(radio, "stop;" + ";".join(events))
+        self._queue(radio, _events_cmd("stop", tuple(events)))
 
     async def dump_stas(self, radio="all"):
         if radio == "all":
             radio = "*"
 
-        await self.send(radio, "dump")
+        await self.send(radio, _DUMP)
 
     async def debugfs_set(self, path, value, radio="all"):
         """
@@ -539,14 +907,16 @@ class AccessPoint:
         `/sys/kernel/debug/ieee80211/<radio>/<path>`. `path` cannot contain `..` or `.`.
         """
         if radio == "all":
-            for radio in self._radios:
-                await self.debugfs_set(path, value, radio=radio)
+            # one write for the commands to all radios
+            async with self.batch():
+                for radio in self._radios:
+                    await self.debugfs_set(path, value, radio=radio)
             return
 
         if radio not in self._radios:
             return
 
-        self._log.debug(f"{self._name}:{radio}: debugfs: setting {path}={value}")
+        self._log.debug("%s:%s: debugfs: setting %s=%s", self._name, radio, path, value)
         await self.send(radio, f"debugfs;{path};{value}")
 
     async def reset_kernel_rate_stats(self, radio="all", sta="all") -> None:
@@ -562,14 +932,14 @@ class AccessPoint:
             raise RadioUnavailableError(self, radio)
 
         if sta == "all":
-            self._log.debug(f"{self._name}:{radio}: Resetting in-kernel rate statistics")
-            await self.send(radio, f"reset_stats;all")
+            self._log.debug("%s:%s: Resetting in-kernel rate statistics", self._name, radio)
+            await self.send(radio, _RESET_STATS_ALL)
         elif (
             sta in self._radios[radio]["stations"]
             and self._radios[radio]["stations"][sta].associated
         ):
-            self._log.debug(f"{self._name}:{radio}:{sta}: Resetting in-kernel rate statistics")
-            await self.send(radio, f"reset_stats;{sta}")
+            self._log.debug("%s:%s:%s: Resetting in-kernel rate statistics", self._name, radio, sta)
+            await self.send(radio, _RESET_STATS_STA % sta.encode("ascii"))
 
     def add_group_rate_info(self, group_ind, group_info):
         self._all_group_info.update({group_ind: group_info})
@@ -582,23 +952,14 @@ class AccessPoint:
         if mode not in ["manual", "auto"]:
             raise ValueError(f"Invalid mode '{mode}', must be either 'manual' or 'auto'")
 
-        self._log.debug(f"{self._name}:{radio}: Setting {which} for all stations to {mode}")
+        self._log.debug("%s:%s: Setting %s for all stations to %s", self._name, radio, which, mode)
 
-        await self.send(radio, f"{which};all;{mode}")
+        await self.send(radio, _ALL_STATIONS_MODE[(which, mode)])
 
-        if radio == "*":
-            for r in self._radios:
-                for sta in [s for s in self.stations(r) if s.associated]:
-                    if which == "rc_mode":
-                        sta._rc_mode = mode
-                    else:
-                        sta._tpc_mode = mode
-        else:
-            for sta in [s for s in self.stations(radio) if s.associated]:
-                if which == "rc_mode":
-                    sta._rc_mode = mode
-                else:
-                    sta._tpc_mode = mode
+        attr = "_rc_mode" if which == "rc_mode" else "_tpc_mode"
+        for sta in self.stations("all" if radio == "*" else radio):
+            if sta.associated:
+                setattr(sta, attr, mode)
 
     async def set_all_stations_rc_mode(self, mode: str, radio="*") -> None:
         """
@@ -619,8 +980,22 @@ class AccessPoint:
         Enable echoing of rc and tpc commands in the form of ORCA API events. This can be useful
         for debugging.
         """
-        action = "start" if enable else "stop"
-        await self.send(radio, f"{action};tprc_echo")
+        await self.send(radio, _TPRC_ECHO[bool(enable)])
+
+
+@lru_cache(maxsize=64)
+def _events_cmd(action: str, events: tuple) -> bytes:
+    # only a handful of event combinations is ever used, encode each of them once
+    return f"{action};{';'.join(events)}".encode("ascii")
+
+
+def _configure_transport(writer: asyncio.StreamWriter):
+    # our commands are small and latency-sensitive, don't let Nagle's algorithm hold them back
+    sock = writer.get_extra_info("socket")
+    if sock is not None:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    writer.transport.set_write_buffer_limits(high=RCD_WRITE_BUFFER_HIGH, low=RCD_WRITE_BUFFER_LOW)
 
 
 def from_file(file: dir, logger=None) -> list:
@@ -630,21 +1005,27 @@ def from_file(file: dir, logger=None) -> list:
     ORCA-RCD listening port, respectively.
     `logger` sets the :class:`logging.Logger` for the newly created :class:`.AccessPoint` s.
     """
+    with open(file, newline="") as csvfile:
+        reader = csv.reader(csvfile)
+        header = next(reader, None)
+        if not header:
+            return []
 
-    def parse_ap(ap):
-        name = ap["NAME"]
-        addr = ap["ADDR"]
+        # resolve the columns once instead of building a dict for every row
+        name_idx = header.index("NAME")
+        addr_idx = header.index("ADDR")
+        port_idx = header.index("RCDPORT") if "RCDPORT" in header else None
 
-        try:
-            rcd_port = int(ap["RCDPORT"])
-        except (KeyError, ValueError):
-            rcd_port = 21059
+        return [_parse_ap(row, name_idx, addr_idx, port_idx, logger) for row in reader if row]
 
-        ap = AccessPoint(name, addr, rcd_port, logger)
-        return ap
 
-    with open(file, newline="") as csvfile:
-        return [parse_ap(ap) for ap in csv.DictReader(csvfile)]
+def _parse_ap(row: list, name_idx: int, addr_idx: int, port_idx: int, logger) -> AccessPoint:
+    try:
+        rcd_port = int(row[port_idx])
+    except (TypeError, IndexError, ValueError):
+        rcd_port = 21059
+
+    return AccessPoint(row[name_idx], row[addr_idx], rcd_port, logger)
 
 
 def from_strings(ap_strs: list, logger=None) -> list:
@@ -663,14 +1044,6 @@ def from_strings(ap_strs: list, logger=None) -> list:
             print(f"Invalid access point: '{apstr}'", file=sys.stderr)
             continue
 
-        name = fields[0]
-        addr = fields[1]
-
-        try:
-            rcd_port = int(fields[2])
-        except (IndexError, ValueError):
-            rcd_port = 21059
-
-        aps.append(AccessPoint(name, addr, rcd_port, logger))
+        aps.append(_parse_ap(fields, 0, 1, 2, logger))
 
     return aps
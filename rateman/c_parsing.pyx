@@ -3,7 +3,7 @@
 import cython
 import array
 from cpython cimport array
-from libc.string cimport strchr, memcpy, memcmp
+from libc.string cimport strchr, strncmp, memcpy
 from libc.stdlib cimport strtoull, strtol
 from libc.limits cimport ULONG_MAX, ULLONG_MAX
 
@@ -23,6 +23,22 @@ cdef int next_field(const char *buf, char c, const char **next):
     return sep - buf
 
 
+@cython.profile(False)
+cdef int count_char(const char *buf, char c, int limit):
+    # count the occurrences of c in the NUL-terminated buf, but stop once limit is exceeded
+    cdef int n = 0
+
+    while buf[0] != 0:
+        if buf[0] == c:
+            n += 1
+            if n > limit:
+                break
+
+        buf += 1
+
+    return n
+
+
 @cython.profile(False)
 cdef int parse_str(const char *buf, char *dst, int size):
     cdef int len = next_field(buf, b';', NULL)
@@ -102,10 +118,6 @@ cdef int _parse_txs(
     cdef int num_acked
     cdef int num_semicolons
 
-    num_semicolons = line.count(b';')
-    if num_semicolons != 10:
-        return -1
-
     ofs = parse_str(cur, phy, 16)
     if (ofs == -1):
         return -1
@@ -118,12 +130,17 @@ cdef int _parse_txs(
         return -1
 
     # check for correct length of timestamp
-    if next - cur != 16:
+    if next - cur != 16 or next[0] != b';':
         return -1
 
     cur = next + 1
 
-    if memcmp(cur, b"txs;", 4):
+    # most lines that are not txs events are rejected here, before looking at the rest of them
+    if strncmp(cur, b"txs;", 4):
+        return -1
+
+    num_semicolons = count_char(cur, b';', 8)
+    if num_semicolons != 8:
         return -1
 
     cur += 4
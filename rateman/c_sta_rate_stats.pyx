@@ -59,15 +59,35 @@ cdef class StationRateStats:
         size_t len
     ):
         cdef int ofs
-
-        if self._stats == NULL:
+        cdef int rate
+        cdef int txpwr
+        cdef size_t i
+
+        # these do not change within the loop, so keep them in locals rather than going through
+        # self and _offset() for every MRR stage
+        cdef unsigned long long *stats = self._stats
+        cdef int rate_stride = self._rate_stride
+        cdef int txpwr_stride = self._txpwr_stride
+        cdef int max_rate_ofs = self._max_rate_ofs
+        cdef int max_txpwr_ofs = self._max_txpwr_ofs
+
+        if stats == NULL:
             return
 
         for i in range(len):
-            ofs = self._offset(rates[i], txpwrs[i])
-            self._stats[ofs] += attempts[i]
-            self._stats[ofs + 1] += successes[i]
-            self._stats[ofs + 2] = timestamp
+            rate = rates[i]
+            txpwr = txpwrs[i]
+
+            if rate == -1:
+                rate = max_rate_ofs
+
+            if txpwr == -1:
+                txpwr = max_txpwr_ofs
+
+            ofs = rate * rate_stride + txpwr * txpwr_stride
+            stats[ofs] += attempts[i]
+            stats[ofs + 1] += successes[i]
+            stats[ofs + 2] = timestamp
 
     def get(self, int rate, int txpwr):
         if self._stats == NULL:
@@ -6,7 +6,12 @@ import rateman
 import traceback
 from contextlib import suppress
 import ast
-from .accesspoint import *
+from .accesspoint import from_file
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 
 def dump_sta_rate_set(sta):
@@ -106,6 +111,13 @@ def show_state(rm):
         dump_radios(ap)
 
 
+async def start_rate_control(stas, rc_alg, rc_opts) -> list:
+    # start the stations' rate control concurrently instead of waiting for each station in turn
+    return await asyncio.gather(
+        *(sta.start_rate_control(rc_alg, rc_opts) for sta in stas), return_exceptions=True
+    )
+
+
 def setup_logger(verbose):
     logging.basicConfig(format="[LOG] %(asctime)s - %(name)s - %(message)s")
     logger = logging.getLogger("rateman")
@@ -151,6 +163,12 @@ def main():
         action="store_true",
         help="Connect to APs and output their state. This is useful for testing",
     )
+    arg_parser.add_argument(
+        "--max-connects",
+        type=int,
+        default=128,
+        help="Maximum number of connections to accesspoints being established concurrently",
+    )
     arg_parser.add_argument(
         "-t", "--time", type=float, default=0.0, help="run for the given number of seconds and exit"
     )
@@ -163,6 +181,9 @@ def main():
         + "RCDPORT is optional and defaults to 21059.",
     )
     args = arg_parser.parse_args()
+    if args.max_connects < 1:
+        arg_parser.error("--max-connects must be at least 1")
+
     logger = setup_logger(args.verbose)
 
     aps = rateman.accesspoint.from_strings(args.accesspoints, logger=logger)
@@ -184,7 +205,8 @@ def main():
         print("ERROR: No accesspoints given", file=sys.stderr)
         sys.exit(1)
 
-    loop = asyncio.new_event_loop()
+    # uvloop's libuv-based event loop lowers the per-event overhead of our socket I/O
+    loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
 
     rm = rateman.RateMan(loop=loop, logger=logger)
@@ -196,11 +218,13 @@ def main():
             ap.start_recording_rcd_trace(f"{ap.name}_trace.csv")
 
     print("Initializing rateman...", end="")
-    loop.run_until_complete(rm.initialize())
+    loop.run_until_complete(rm.initialize(max_connects=args.max_connects))
     print("OK")
 
     if args.enable_events:
-        loop.run_until_complete(ap.enable_events(events=args.enable_events))
+        for ap in rm.accesspoints:
+            if ap.connected:
+                loop.run_until_complete(ap.enable_events(events=args.enable_events))
 
     if args.show_state:
         show_state(rm)
@@ -208,17 +232,18 @@ def main():
         loop.close()
         return 0
 
-    for ap in rm.accesspoints:
-        for sta in ap.stations():
-            print(f"Starting rate control scheme '{args.algorithm}' for {sta}")
-            try:
-                loop.run_until_complete(sta.start_rate_control(args.algorithm, options))
-            except Exception as e:
-                tb = traceback.extract_tb(e.__traceback__)[-1]
-                logger.error(
-                    f"Error starting rc algorithm '{args.algorithm}' for {sta}: "
-                    f"{e} (({tb.filename}:{tb.lineno}))"
-                )
+    stas = [sta for ap in rm.accesspoints for sta in ap.stations()]
+    for sta in stas:
+        print(f"Starting rate control scheme '{args.algorithm}' for {sta}")
+
+    results = loop.run_until_complete(start_rate_control(stas, args.algorithm, options))
+    for sta, e in zip(stas, results):
+        if isinstance(e, Exception):
+            tb = traceback.extract_tb(e.__traceback__)[-1]
+            logger.error(
+                f"Error starting rc algorithm '{args.algorithm}' for {sta}: "
+                f"{e} (({tb.filename}:{tb.lineno}))"
+            )
 
     print("Running rateman... (Press CTRL+C to stop)")
 
@@ -42,7 +42,7 @@ class ParsingError(RateManError):
         self._ap = ap
 
     def __repr__(self):
-        return f"{self._ap}: {msg}"
+        return f"{self._ap}: {self._msg}"
 
 
 class UnsupportedAPIVersionError(RateManError):
@@ -53,12 +53,16 @@ class UnsupportedAPIVersionError(RateManError):
         self._supported = supported_version
 
     def __str__(self):
-        return f"{self._ap.name} announced unsupported API version {self._announced}. "
-        f"We support {self._supported}"
+        return (
+            f"{self._ap.name} announced unsupported API version {self._announced}. "
+            f"We support {self._supported}"
+        )
 
     def __repr__(self):
-        return f"Unsupported API version for {self._ap}: {self._announced} "
-        f"(we support {self._supported})"
+        return (
+            f"Unsupported API version for {self._ap}: {self._announced} "
+            f"(we support {self._supported})"
+        )
 
 
 class UnsupportedFeatureException(RateManError):
@@ -111,7 +115,7 @@ class RadioConfigError(AccessPointError):
         self._radio = radio
 
     def __repr__(self):
-        return f"{self._ap.name}:{self._radio}: {msg}"
+        return f"{self._ap.name}:{self._radio}: {self._msg}"
 
 
 class RadioUnavailableError(RadioError):
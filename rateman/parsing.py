@@ -4,13 +4,23 @@
 #
 
 import re
+import sys
 import array
+import asyncio
 from .station import Station
 from .exception import UnsupportedAPIVersionError, ParsingError
 from .c_parsing import parse_txs
-from .rate_info import *
-
-__all__ = ["process_api", "process_line", "process_header", "parse_sta", "rate_group_and_offset"]
+from .rate_info import parse_group_info
+
+__all__ = [
+    "process_api",
+    "process_line",
+    "process_txs",
+    "process_event",
+    "process_header",
+    "parse_sta",
+    "rate_group_and_offset",
+]
 
 API_VERSION = (2, 1)
 
@@ -25,8 +35,16 @@ def twos_complement(hexstr, bitwidth):
     return val - (1 << bitwidth) if val & (1 << (bitwidth - 1)) else val
 
 
+# RSSI values of rxs events are parsed with parse_s8(). They are hex strings of at most two
+# digits, so the results for all of them are computed once and looked up instead of converted.
+_S8 = {f"{i:{w}}": i - 256 if i & 0x80 else i for i in range(256) for w in ["x", "02x"]}
+
+
 def parse_s8(s):
-    return twos_complement(s, 8)
+    try:
+        return _S8[s]
+    except KeyError:
+        return twos_complement(s, 8)
 
 
 def parse_s16(s):
@@ -101,7 +119,7 @@ def parse_tpc(ap: "AccessPoint", cap: list) -> dict:
 
 
 def parse_features(ap: "AccessPoint", features: list) -> dict:
-    return {feature: setting for feature, setting in [f.split(",") for f in features]}
+    return {feature: setting for feature, setting in (f.split(",") for f in features)}
 
 
 def process_phy_info(ap, fields):
@@ -135,30 +153,52 @@ async def process_sta_info(ap, fields):
             await ap.update_station(sta)
 
 
+def write_header(path, lines):
+    with open(path, "w") as header_file:
+        header_file.writelines(lines)
+
+
 async def process_header(ap, path):
-    header_file = open(path, "w")
+    header = []
     async for line in ap.api_info():
-        if line.startswith("*;0;#"):
-            continue
-        elif line.startswith("*;0;"):
-            process_api(ap, line.split(";"), line)
-        elif "0;add;" in line:
-            process_phy_info(ap, line.split(";"))
-        elif "0;sta;add;" in line:
-            await process_sta_info(ap, line.split(";"))
-        header_file.write(line + "\n")
-    header_file.close()
+        fields = line.split(";")
+        match fields[:4]:
+            case ["*", "0", kind, *_]:
+                if kind.startswith("#"):
+                    continue
+                process_api(ap, fields, line)
+            case [_, "0", "add", *_]:
+                process_phy_info(ap, fields)
+            case [_, "0", "sta", "add"]:
+                await process_sta_info(ap, fields)
+        header.append(line + "\n")
+
+    # write the header in a worker thread so that file I/O does not block the event loop
+    await asyncio.to_thread(write_header, path, header)
     ap.header_collected = True
 
 
 async def process_line(ap, line):
     # FIXME: This is where the AP's raw data callbacks should be called
 
-    if (result := parse_txs(line)) is not None:
-        update_rate_stats_from_txs(ap, *result)
+    if process_txs(ap, line):
         return None
 
-    elif fields := validate_line(ap, line.decode("utf-8").rstrip()):
+    return await process_event(ap, line)
+
+
+def process_txs(ap, line) -> bool:
+    # txs events make up most of the traffic and never need to await anything. Handling them in a
+    # plain function spares creating and running a coroutine for each of them.
+    if (result := parse_txs(line)) is None:
+        return False
+
+    update_rate_stats_from_txs(ap, *result)
+    return True
+
+
+async def process_event(ap, line):
+    if fields := validate_line(ap, line.decode("utf-8")):
         match fields[2]:
             case "rxs":
                 sta = ap.get_sta(fields[3], radio=fields[0])
@@ -287,7 +327,7 @@ def parse_mrr_stage(s):
     count = int(mrr_stage[1], 16)
     txpwr_idx = int(mrr_stage[2], 16) if mrr_stage[2] else None
 
-    return mrr_stage[0].zfill(2), int(mrr_stage[1], 16), txpwr_idx
+    return rate, count, txpwr_idx
 
 
 def update_rate_stats_from_txs(
@@ -308,12 +348,18 @@ def update_rate_stats_from_txs(
     sta.update_ampdu(num_frames)
 
 
+# offsets of the rates within their group that are set in a group's rate mask, for every mask
+_MASK_OFFSETS = [tuple(ofs for ofs in range(10) if mask & (1 << ofs)) for mask in range(1 << 10)]
+
+
 def parse_sta(ap, fields: list):
     supported_rates = []
-    radio = fields[0]
+    # these end up as dict keys and attributes of every station. Interning them shares one string
+    # object among all stations instead of keeping a copy per line they were parsed from.
+    radio = sys.intern(fields[0])
     timestamp = int(fields[1], 16)
-    mac = fields[4]
-    iface = fields[5]
+    mac = sys.intern(fields[4])
+    iface = sys.intern(fields[5])
     rc_mode = fields[6]
     tpc_mode = fields[7]
     overhead_mcs = int(fields[8], 16)
@@ -322,11 +368,15 @@ def parse_sta(ap, fields: list):
     sample_freq = int(fields[11], 16)
     mcs_groups = fields[12:]
 
+    # look the supported rates of each group up by its mask instead of testing the mask's bits
     for i, grp_idx in enumerate(ap.all_group_info):
-        mask = int(mcs_groups[i], 16)
-        for ofs in range(10):
-            if mask & (1 << ofs):
-                supported_rates.append(i * 16 + ofs)
+        mask = mcs_groups[i]
+        if mask == "0":
+            # most groups are not supported by the station at all
+            continue
+
+        base = i * 16
+        supported_rates.extend([base + ofs for ofs in _MASK_OFFSETS[int(mask, 16) & 0x3FF]])
 
     return Station(
         mac,
@@ -6,13 +6,17 @@
 import logging
 import asyncio
 import traceback
-from contextlib import suppress
 import os
 from .accesspoint import AccessPoint
 from .station import Station
-from .parsing import *
+from .parsing import process_header, process_txs, process_event
 from .exception import UnsupportedAPIVersionError
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 __all__ = ["RateMan"]
 
 
@@ -20,7 +24,8 @@ class RateMan:
     """
 
     :ivar asyncio.BaseEventLoop loop:   The event loop on which rateman is to run. If none is
-                                        provided, a new one will be created.
+                                        provided, a new one will be created. That is a uvloop
+                                        event loop if uvloop is installed.
     :ivar logging.Logger logger:    The logger for this rateman instance. If none is given, a new
                                     one will be created.
     """
@@ -30,8 +35,8 @@ class RateMan:
 
         if not loop:
             self._log.debug("Creating new event loop")
-            self._loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+            self._loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
             self._new_loop_created = True
         else:
             self._loop = loop
@@ -62,7 +67,7 @@ class RateMan:
         """
         Return the :class:`.Station` object identified by the given MAC address.
         """
-        for ap in self._accesspoints:
+        for ap, _ in self._accesspoints.values():
             sta = ap.get_sta(mac)
             if sta:
                 return sta
@@ -72,7 +77,7 @@ class RateMan:
     async def ap_connection(self, ap: AccessPoint, path, timeout=5):
         ap_header_path = os.path.join(path, f"{ap.name}_orca_header.csv")
         while True:
-            self._log.debug(f"Connecting to {ap}, timeout={timeout} s")
+            self._log.debug("Connecting to %s, timeout=%s s", ap, timeout)
             try:
                 async with asyncio.timeout(timeout):
                     await ap.connect()
@@ -94,10 +99,20 @@ class RateMan:
                 await asyncio.sleep(timeout)
                 continue
 
+    async def _connect_accesspoint(
+        self, ap: AccessPoint, path, timeout, connect_slots: asyncio.Semaphore
+    ):
+        # the deadline only starts once we hold a connection slot, so accesspoints queued behind
+        # others get their full timeout
+        async with connect_slots:
+            async with asyncio.timeout(timeout):
+                await self.ap_connection(ap, path, timeout=timeout)
+
     async def rcd_connection(self, ap: AccessPoint):
         try:
             async for line in ap.events():
-                await process_line(ap, line)
+                if not process_txs(ap, line):
+                    await process_event(ap, line)
         except asyncio.CancelledError as e:
             raise e
 
@@ -105,6 +120,7 @@ class RateMan:
         self,
         path: str = None,
         timeout: int = 5,
+        max_connects: int = 128,
     ):
         """
         Establish connections to access points and process the information they provide. When this
@@ -119,25 +135,33 @@ class RateMan:
         timeout : int
             The timeout for the connection attempt. This is also the time that rateman will wait
             before making a new connection attempt.
+
+        max_connects : int
+            The maximum number of accesspoints to which connections are being established at the
+            same time. Limiting this avoids connection storms when managing many accesspoints.
+            Accesspoints beyond that number wait for a free slot before their timeout starts, so
+            initializing N accesspoints may take up to ``ceil(N / max_connects) * timeout``. Must be
+            at least 1.
         """
+        if max_connects < 1:
+            raise ValueError(f"Invalid max_connects {max_connects}, must be at least 1")
+
         if not path:
             path = os.getcwd()
+
+        connect_slots = asyncio.Semaphore(max_connects)
         tasks = [
             self._loop.create_task(
-                self.ap_connection(ap, path, timeout=timeout), name=f"connect_{ap.name}"
+                self._connect_accesspoint(ap, path, timeout, connect_slots),
+                name=f"connect_{ap.name}",
             )
             for ap in self.accesspoints
         ]
 
-        done, pending = await asyncio.wait(tasks, timeout=timeout)
-        for task in pending:
-            with suppress(asyncio.CancelledError):
-                task.cancel()
-                await task
-
-        for task in done:
-            if task.exception():
-                self._log.error(f"{task.exception()}")
+        for result in await asyncio.gather(*tasks, return_exceptions=True):
+            # accesspoints that timed out are reported below
+            if isinstance(result, Exception) and not isinstance(result, TimeoutError):
+                self._log.error(f"{result}")
 
         for (addr, port), (ap, _) in self._accesspoints.items():
             if ap.connected:
@@ -148,6 +172,29 @@ class RateMan:
                     f"Connection to {ap} could not be established in time (timeout={timeout}s)"
                 )
 
+    async def _stop_accesspoint(self, ap: AccessPoint, rcd_connection: asyncio.Task):
+        stas = []
+        try:
+            async with ap.batch():
+                for radio in ap.radios:
+                    stas += [sta for sta in ap.stations(radio) if sta.associated]
+                    await ap.disable_events(radio, ap.enabled_events(radio))
+
+                for sta in stas:
+                    await sta.start_rate_control(
+                        "minstrel_ht_kernel_space", {"update_freq": 20, "sample_freq": 50}
+                    )
+
+            await ap.disconnect()
+        except Exception as e:
+            # do not leave the connection open if the orderly shutdown failed
+            ap._drop_connection()
+            raise e
+        finally:
+            # the event reader must not outlive the accesspoint's shutdown in any case
+            rcd_connection.cancel()
+            await asyncio.gather(rcd_connection, return_exceptions=True)
+
     async def stop(self):
         """
         Stop all running tasks and disconnect from all accesspoints. Kernel rate control will be
@@ -155,24 +202,20 @@ class RateMan:
         """
         self._log.debug("Stopping RateMan")
 
-        for _, (ap, rcd_connection) in self._accesspoints.items():
-            if not ap.connected:
-                continue
-
-            stas = []
-            for radio in ap.radios:
-                stas += [sta for sta in ap.stations(radio) if sta.associated]
-                await ap.disable_events(radio, ap.enabled_events(radio))
-
-            for sta in stas:
-                await sta.start_rate_control(
-                    "minstrel_ht_kernel_space", {"update_freq": 20, "sample_freq": 50}
-                )
-
-            await ap.disconnect()
-            rcd_connection.cancel()
-            with suppress(asyncio.CancelledError):
-                await rcd_connection
+        aps = [
+            (ap, rcd_connection)
+            for ap, rcd_connection in self._accesspoints.values()
+            if ap.connected
+        ]
+        results = await asyncio.gather(
+            *(self._stop_accesspoint(ap, rcd_connection) for ap, rcd_connection in aps),
+            return_exceptions=True,
+        )
+
+        # one accesspoint failing to shut down cleanly must not keep the others from stopping
+        for (ap, _), result in zip(aps, results):
+            if isinstance(result, Exception):
+                self._log.error(f"{ap}: Failed to stop: {result.__repr__()}")
 
         self._accesspoints = {}
 
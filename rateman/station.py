@@ -12,6 +12,12 @@ from .exception import RateControlConfigError, StationError, RadioError
 
 __all__ = ["Station"]
 
+_STA_CMDS = ["rc_mode", "tpc_mode", "set_rates", "set_power", "set_rates_power", "set_probe"]
+_MODES = {"manual": b"manual", "auto": b"auto"}
+
+# tx power indices of an MRR chain whose tx power is under kernel control. Only ever read.
+_AUTO_TXPWRS = array("i", [-1, -1, -1, -1])
+
 
 class Station:
     """
@@ -23,6 +29,43 @@ class Station:
     for resource control schemes.
     """
 
+    # one instance per station, their attributes are read for every txs event
+    __slots__ = (
+        "_mac_addr",
+        "_accesspoint",
+        "_loop",
+        "_radio",
+        "_iface",
+        "_supported_rates",
+        "_rate_mask",
+        "_supported_powers",
+        "_txpwr_idx",
+        "_last_seen",
+        "_rc_mode",
+        "_kernel_update_freq",
+        "_kernel_sample_freq",
+        "_tpc_mode",
+        "_overhead_mcs",
+        "_overhead_legacy",
+        "_ampdu_enabled",
+        "_ampdu_aggregates",
+        "_ampdu_subframes",
+        "_stats",
+        "_rssi",
+        "_rssi_vals",
+        "_rate_control_algorithm",
+        "_rate_control_options",
+        "_rc",
+        "_rc_module",
+        "_rc_ctx",
+        "_rc_pause_on_disassoc",
+        "_rc_paused",
+        "_log",
+        "_cmd_prefix",
+        "_mrr_templates",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         mac_addr: str,
@@ -46,8 +89,9 @@ class Station:
         self._loop = ap.loop
         self._radio = radio
         self._iface = iface
-        self._supported_rates = supported_rates
+        self.supported_rates = supported_rates
         self._supported_powers = None
+        self._txpwr_idx = {}
         self._last_seen = timestamp
         self._rc_mode = rc_mode
         self._kernel_update_freq = update_freq
@@ -71,6 +115,10 @@ class Station:
         self._rc_paused = False
         self._log = logger if logger else logging.getLogger()
 
+        # pre-encoded command prefixes for the mode switches and the rate and power setters
+        self._cmd_prefix = {cmd: f"{cmd};{mac_addr};".encode("ascii") for cmd in _STA_CMDS}
+        self._mrr_templates = {}
+
     @property
     def loop(self):
         return self._loop
@@ -165,7 +213,8 @@ class Station:
 
         await self._accesspoint.send(
             self._radio,
-            f"rc_mode;{self._mac_addr};{self._rc_mode};{freq:x};{self._kernel_sample_freq:x}",
+            self._cmd_prefix["rc_mode"]
+            + b"%s;%x;%x" % (_MODES[self._rc_mode], freq, self._kernel_sample_freq),
         )
 
     @property
@@ -190,7 +239,8 @@ class Station:
         self._kernel_sample_freq = freq
         await self._accesspoint.send(
             self._radio,
-            f"rc_mode;{self._mac_addr};{self._rc_mode};{self._kernel_update_freq:x};{freq:x}",
+            self._cmd_prefix["rc_mode"]
+            + b"%s;%x;%x" % (_MODES[self._rc_mode], self._kernel_update_freq, freq),
         )
 
     @property
@@ -224,6 +274,10 @@ class Station:
     @supported_rates.setter
     def supported_rates(self, rates: list):
         self._supported_rates = rates
+        self._rate_mask = _rate_mask(rates)
+
+    def _supports_rate(self, rate: int) -> bool:
+        return 0 <= rate < len(self._rate_mask) and self._rate_mask[rate] != 0
 
     @property
     def supported_powers(self) -> list[float]:
@@ -235,6 +289,8 @@ class Station:
     @supported_powers.setter
     def supported_powers(self, powers: list):
         self._supported_powers = powers
+        # lookup table mapping tx power levels to the indices used by the ORCA API
+        self._txpwr_idx = {p: i for i, p in enumerate(powers)} if powers else {}
 
     @property
     def mac_addr(self) -> str:
@@ -250,7 +306,10 @@ class Station:
         rate at the given txpower.
         """
         if txpower is not None:
-            txpower = self._supported_powers.index(txpower)
+            try:
+                txpower = self._txpwr_idx[txpower]
+            except KeyError:
+                raise ValueError(f"{self}: Unsupported TX power level: {txpower}") from None
         else:
             txpower = -1
 
@@ -305,9 +364,11 @@ class Station:
         if self._rc:
             try:
                 self._log.debug(
-                    f"{self.accesspoint.name}:{self.mac_addr}: Stopping rate control algorithm "
-                    f"{self._rate_control_algorithm}, "
-                    f"options={self._rate_control_options}"
+                    "%s:%s: Stopping rate control algorithm %s, options=%s",
+                    self.accesspoint.name,
+                    self.mac_addr,
+                    self._rate_control_algorithm,
+                    self._rate_control_options,
                 )
                 self._rc.cancel()
                 with suppress(asyncio.CancelledError):
@@ -352,25 +413,29 @@ class Station:
             await self.stop_rate_control()
 
         self._log.debug(
-            f"{self.accesspoint.name}:{self.mac_addr}: "
-            f"Start rate control algorithm '{rc_alg}', options={rc_opts}."
+            "%s:%s: Start rate control algorithm '%s', options=%s.",
+            self.accesspoint.name,
+            self.mac_addr,
+            rc_alg,
+            rc_opts,
         )
 
         if rc_alg == "minstrel_ht_kernel_space":
-            await self.set_manual_rc_mode(False)
-            await self.set_manual_tpc_mode(False)
+            # switch modes and configure kernel rc with a single write to the accesspoint
+            async with self._accesspoint.batch():
+                await self.set_manual_rc_mode(False)
+                await self.set_manual_tpc_mode(False)
 
-            rc_task = None
-            if rc_opts:
-                if rc_opts.get("reset_rate_stats", False):
-                    await self.reset_kernel_rate_stats()
-                    self.reset_rate_stats()
+                if rc_opts:
+                    if rc_opts.get("reset_rate_stats", False):
+                        await self.reset_kernel_rate_stats()
+                        self.reset_rate_stats()
 
-                if "update_freq" in rc_opts:
-                    await self.set_kernel_stats_update_freq(rc_opts["update_freq"])
+                    if "update_freq" in rc_opts:
+                        await self.set_kernel_stats_update_freq(rc_opts["update_freq"])
 
-                if "sample_freq" in rc_opts:
-                    await self.set_kernel_sample_freq(rc_opts["sample_freq"])
+                    if "sample_freq" in rc_opts:
+                        await self.set_kernel_sample_freq(rc_opts["sample_freq"])
         else:
             self._rc_module = rate_control.load(rc_alg)
 
@@ -401,8 +466,10 @@ class Station:
             )
 
         self._log.debug(
-            f"{self.accesspoint.name}:{self.mac_addr}: Pause rate control"
-            f" {self._rate_control_algorithm}."
+            "%s:%s: Pause rate control %s.",
+            self.accesspoint.name,
+            self.mac_addr,
+            self._rate_control_algorithm,
         )
         await self._rc_module.pause(self._rc_ctx)
 
@@ -411,8 +478,9 @@ class Station:
         weakref.finalize(self, cleanup_sta_rc, self)
 
         if self.associated:
-            await self.set_manual_rc_mode(False)
-            await self.set_manual_tpc_mode(False)
+            async with self._accesspoint.batch():
+                await self.set_manual_rc_mode(False)
+                await self.set_manual_tpc_mode(False)
         else:
             self._rc_mode = "auto"
             self._tpc_mode = "auto"
@@ -431,8 +499,10 @@ class Station:
             raise StationError(self, f"Not associated")
 
         self._log.debug(
-            f"{self.accesspoint.name}:{self.mac_addr}: Resume rate control "
-            f"{self._rate_control_algorithm}."
+            "%s:%s: Resume rate control %s.",
+            self.accesspoint.name,
+            self.mac_addr,
+            self._rate_control_algorithm,
         )
         await self._rc_module.resume(self._rc_ctx)
         self._rc_paused = False
@@ -448,7 +518,7 @@ class Station:
         self, timestamp: int, rates: array, txpwrs: array, attempts: array, successes: array
     ):
         if self._tpc_mode == "auto":
-            txpwrs = array("i", [-1, -1, -1, -1])
+            txpwrs = _AUTO_TXPWRS
         self._stats.update(timestamp, rates, txpwrs, attempts, successes, 4)
 
         self._last_seen = timestamp
@@ -474,7 +544,13 @@ class Station:
         Reset packet transmission attempts and success statistics for all supported rates and
         transmit power levels.
         """
-        self._stats = StationRateStats(0x29A, len(self._accesspoint.txpowers(self._radio)))
+        n_txpwrs = len(self._accesspoint.txpowers(self._radio))
+
+        # keep using the flat per-station stats table rather than creating a new object
+        if self._stats is None:
+            self._stats = StationRateStats(0x29A, n_txpwrs)
+        else:
+            self._stats.reset(0x29A, n_txpwrs)
 
     async def reset_kernel_rate_stats(self):
         """
@@ -493,9 +569,9 @@ class Station:
             return
 
         mode = "manual" if enable else "auto"
-        await self._accesspoint.send(self._radio, f"rc_mode;{self._mac_addr};{mode}")
+        await self._accesspoint.send(self._radio, self._cmd_prefix["rc_mode"] + _MODES[mode])
         self._rc_mode = mode
-        self._log.debug(f"{self.accesspoint.name}:{self.mac_addr}: Set rc_mode={mode}.")
+        self._log.debug("%s:%s: Set rc_mode=%s.", self._accesspoint.name, self._mac_addr, mode)
 
     async def set_manual_tpc_mode(self, enable: bool):
         """
@@ -516,28 +592,35 @@ class Station:
 
         mode = "manual" if enable else "auto"
         if self._accesspoint.radios[self._radio]["tpc"]:
-            await self._accesspoint.send(self._radio, f"tpc_mode;{self._mac_addr};{mode}")
+            await self._accesspoint.send(self._radio, self._cmd_prefix["tpc_mode"] + _MODES[mode])
             self._tpc_mode = mode
-            self._log.debug(f"{self.accesspoint.name}:{self.mac_addr}: Set tpc_mode={mode}.")
+            self._log.debug("%s:%s: Set tpc_mode=%s.", self._accesspoint.name, self._mac_addr, mode)
 
     def _validate_txpwrs(self, pwrs: list[int]) -> list[int]:
-        txpwr_indeces = []
-
-        for p in pwrs:
-            for i, txpwr in enumerate(self._supported_powers):
-                if p == txpwr:
-                    txpwr_indeces.append(i)
-                    i = 0
-                    break
-
-            if i != 0:
-                raise RadioError(self._accesspoint, self._radio, f"Unsupported TX power level: {p}")
-
-        return txpwr_indeces
+        try:
+            return [self._txpwr_idx[p] for p in pwrs]
+        except KeyError as e:
+            raise RadioError(
+                self._accesspoint, self._radio, f"Unsupported TX power level: {e.args[0]}"
+            ) from None
+
+    def _mrr_template(self, cmd: str, stage: bytes, n_stages: int) -> bytes:
+        # Commands for a given MRR length are always formatted the same way. Build the bytes
+        # template with our MAC address baked in once and only fill in the numbers per call.
+        key = (cmd, n_stages)
+        tmpl = self._mrr_templates.get(key)
+        if tmpl is None:
+            tmpl = self._cmd_prefix[cmd] + b";".join([stage] * n_stages)
+            self._mrr_templates[key] = tmpl
+
+        return tmpl
 
     def _validate_rates(self, rates: list[int]):
+        # same check as _supports_rate(), inlined to save a method call per MRR stage
+        mask = self._rate_mask
+        n = len(mask)
         for r in rates:
-            if r not in self._supported_rates:
+            if not (0 <= r < n and mask[r]):
                 raise StationError(self, f"Unsupported rate: {r:x}")
 
     async def set_rates(self, rates: list[int], counts: list[int]):
@@ -557,8 +640,8 @@ class Station:
 
         self._validate_rates(rates)
 
-        mrr = ";".join([f"{r:x},{c:x}" for (r, c) in zip(rates, counts)])
-        await self._accesspoint.send(self._radio, f"set_rates;{self._mac_addr};{mrr}")
+        tmpl = self._mrr_template("set_rates", b"%x,%x", len(rates))
+        await self._accesspoint.send(self._radio, tmpl % _interleave(rates, counts))
 
     async def set_power(self, pwrs: list[float]):
         """
@@ -574,12 +657,10 @@ class Station:
         if self._tpc_mode != "manual":
             raise StationError(self, "Need to be in manual power control mode to set TX power")
 
-        self._validate_txpwrs(pwrs)
-
-        txpwrs = [self._supported_powers.index(p) for p in pwrs]
-        txpwrs = ";".join([f"{idx:x}" for idx in txpwrs])
+        txpwrs = self._validate_txpwrs(pwrs)
+        tmpl = self._mrr_template("set_power", b"%x", len(txpwrs))
 
-        await self._accesspoint.send(self._radio, f"set_power;{self._mac_addr};{txpwrs}")
+        await self._accesspoint.send(self._radio, tmpl % tuple(txpwrs))
 
     async def set_rates_and_power(self, rates: list[int], counts: list[int], pwrs: list[float]):
         """
@@ -602,11 +683,9 @@ class Station:
             )
 
         self._validate_rates(rates)
-        self._validate_txpwrs(pwrs)
-
-        txpwrs = [self._supported_powers.index(p) for p in pwrs]
-        mrr = ";".join([f"{r:x},{c:x},{p:x}" for (r, c, p) in zip(rates, counts, txpwrs)])
-        await self._accesspoint.send(self._radio, f"set_rates_power;{self._mac_addr};{mrr}")
+        txpwrs = self._validate_txpwrs(pwrs)
+        tmpl = self._mrr_template("set_rates_power", b"%x,%x,%x", len(rates))
+        await self._accesspoint.send(self._radio, tmpl % _interleave(rates, counts, txpwrs))
 
     async def set_probe_rate(self, rate: int, count: int, txpwr: int = None):
         """
@@ -617,7 +696,7 @@ class Station:
         `StationError` if the station is not in manual rc mode. It will also raise a `StationError`
         if `txpwr` is not `None` and the station is not in manual tpc mode.
         """
-        if rate not in self._supported_rates:
+        if not self._supports_rate(rate):
             raise ValueError(f"{self}: Cannot probe '{rate}': Not supported")
 
         if self._rc_mode != "manual":
@@ -629,13 +708,10 @@ class Station:
                 "Need to be in manual transmit power control mode to set " "tpc for a probe rate",
             )
 
-        self._validate_rates([rate])
-
-        cmd = f"set_probe;{self._mac_addr};{rate:x},{count:x}"
+        cmd = self._cmd_prefix["set_probe"] + b"%x,%x" % (rate, count)
 
         if txpwr is not None:
-            self._validate_txpwrs([txpwr])
-            cmd += f",{self._supported_powers.index(txpwr):x}"
+            cmd += b",%x" % self._validate_txpwrs([txpwr])[0]
 
         await self._accesspoint.send(self._radio, cmd)
 
@@ -643,6 +719,26 @@ class Station:
         return f"STA[{self._mac_addr}]"
 
 
+def _interleave(*seqs) -> tuple:
+    # (r0, r1), (c0, c1) -> (r0, c0, r1, c1) using slice assignments rather than zipping and
+    # flattening element by element
+    n = len(seqs)
+    args = [None] * (n * len(seqs[0]))
+    for i, seq in enumerate(seqs):
+        args[i::n] = seq
+
+    return tuple(args)
+
+
+def _rate_mask(rates: list) -> bytearray:
+    # rate indices are small and dense, so a flat byte mask gives O(1) membership tests
+    mask = bytearray(max(rates) + 1 if rates else 0)
+    for rate in rates:
+        mask[rate] = 1
+
+    return mask
+
+
 def handle_rc_exception(sta: Station, future):
     try:
         exception = future.exception()